@@ -16,6 +16,15 @@ SCORE_TYPE_ORDER = [
     "quad_bogey",
 ]
 
+# to-par -> analytics score bucket; <= -2 is "eagle" and >= 4 is "quad_bogey".
+_SCORE_TYPE_BY_TO_PAR = {
+    -1: "birdie",
+    0: "par",
+    1: "bogey",
+    2: "double_bogey",
+    3: "triple_bogey",
+}
+
 
 def _valid_hole_scores(round_obj: Round):
     return [score for score in round_obj.hole_scores if score.hole_number is not None]
@@ -91,25 +100,22 @@ def _average_non_null(values: List[Optional[float]]) -> Optional[float]:
 
 
 def _score_type_from_to_par(to_par: int) -> str:
-    if to_par <= -2:
-        return "eagle"
-    if to_par == -1:
-        return "birdie"
-    if to_par == 0:
-        return "par"
-    if to_par == 1:
-        return "bogey"
-    if to_par == 2:
-        return "double_bogey"
-    if to_par == 3:
-        return "triple_bogey"
-    return "quad_bogey"
+    score_type = _SCORE_TYPE_BY_TO_PAR.get(to_par)
+    if score_type is not None:
+        return score_type
+    return "eagle" if to_par <= -2 else "quad_bogey"
 
 
 def _format_date_short(dt: datetime) -> str:
     return f"{dt.year}/{dt.month}/{dt.day}"
 
 
+def parse_date_short(value: str) -> datetime:
+    """Inverse of _format_date_short; avoids strptime's format parsing."""
+    year, month, day = value.split("/")
+    return datetime(int(year), int(month), int(day))
+
+
 def _course_label(round_obj: Round) -> Optional[str]:
     if round_obj.course and round_obj.course.name:
         return round_obj.course.name
@@ -357,12 +363,14 @@ def notable_achievements(
     rounds_list = list(rounds)
 
     rounds_year = [r for r in rounds_list if r.date is not None and cutoff <= r.date <= now]
+    # Score/putts/GIR per round, summed once; the records below read them many times.
+    round_totals = {id(r): r.calculate_totals() for r in rounds_list}
 
     lifetime_holes = _achievement_hole_rows(rounds_list)
     year_holes = _achievement_hole_rows(rounds_year)
 
-    lifetime_round_scores = [s for s in (r.calculate_total_score() for r in rounds_list) if s is not None]
-    year_round_scores = [s for s in (r.calculate_total_score() for r in rounds_year) if s is not None]
+    lifetime_round_scores = [s for s in (round_totals[id(r)]["total"] for r in rounds_list) if s is not None]
+    year_round_scores = [s for s in (round_totals[id(r)]["total"] for r in rounds_year) if s is not None]
 
     lowest_9_lifetime, lowest_9_lifetime_event = _lowest_9_with_event(rounds_list)
 
@@ -373,31 +381,31 @@ def notable_achievements(
             "lowest_9_holes": lowest_9_lifetime,
             "most_birdies_in_round": _best_round_metric(rounds_list, lambda r: _count_score_type(_achievement_hole_rows([r]), "birdie")),
             "most_eagles_in_round": _best_round_metric(rounds_list, lambda r: _count_score_type(_achievement_hole_rows([r]), "eagle")),
-            "most_gir_in_round": _best_round_metric(rounds_list, lambda r: r.get_total_gir()),
-            "fewest_putts_in_round": min([value for value in (r.get_total_putts() for r in rounds_list) if value is not None], default=None),
+            "most_gir_in_round": _best_round_metric(rounds_list, lambda r: round_totals[id(r)]["gir"]),
+            "fewest_putts_in_round": min([value for value in (round_totals[id(r)]["putts"] for r in rounds_list) if value is not None], default=None),
         },
         "one_year": {
             "lowest_round": min(year_round_scores) if year_round_scores else None,
             "most_birdies_in_round": _best_round_metric(rounds_year, lambda r: _count_score_type(_achievement_hole_rows([r]), "birdie")),
-            "most_gir_in_round": _best_round_metric(rounds_year, lambda r: r.get_total_gir()),
-            "fewest_putts_in_round": min([value for value in (r.get_total_putts() for r in rounds_year) if value is not None], default=None),
+            "most_gir_in_round": _best_round_metric(rounds_year, lambda r: round_totals[id(r)]["gir"]),
+            "fewest_putts_in_round": min([value for value in (round_totals[id(r)]["putts"] for r in rounds_year) if value is not None], default=None),
         },
     }
     scoring_records_events = {
         "lifetime": {
-            "lowest_round": _best_round_event(rounds_list, lambda r: r.calculate_total_score(), prefer_lower=True),
-            "highest_round": _best_round_event(rounds_list, lambda r: r.calculate_total_score()),
+            "lowest_round": _best_round_event(rounds_list, lambda r: round_totals[id(r)]["total"], prefer_lower=True),
+            "highest_round": _best_round_event(rounds_list, lambda r: round_totals[id(r)]["total"]),
             "lowest_9_holes": lowest_9_lifetime_event,
             "most_birdies_in_round": _best_round_event(rounds_list, lambda r: _count_score_type(_achievement_hole_rows([r]), "birdie")),
             "most_eagles_in_round": _best_round_event(rounds_list, lambda r: _count_score_type(_achievement_hole_rows([r]), "eagle")),
-            "most_gir_in_round": _best_round_event(rounds_list, lambda r: r.get_total_gir()),
-            "fewest_putts_in_round": _best_round_event(rounds_list, lambda r: r.get_total_putts(), prefer_lower=True),
+            "most_gir_in_round": _best_round_event(rounds_list, lambda r: round_totals[id(r)]["gir"]),
+            "fewest_putts_in_round": _best_round_event(rounds_list, lambda r: round_totals[id(r)]["putts"], prefer_lower=True),
         },
         "one_year": {
-            "lowest_round": _best_round_event(rounds_year, lambda r: r.calculate_total_score(), prefer_lower=True),
+            "lowest_round": _best_round_event(rounds_year, lambda r: round_totals[id(r)]["total"], prefer_lower=True),
             "most_birdies_in_round": _best_round_event(rounds_year, lambda r: _count_score_type(_achievement_hole_rows([r]), "birdie")),
-            "most_gir_in_round": _best_round_event(rounds_year, lambda r: r.get_total_gir()),
-            "fewest_putts_in_round": _best_round_event(rounds_year, lambda r: r.get_total_putts(), prefer_lower=True),
+            "most_gir_in_round": _best_round_event(rounds_year, lambda r: round_totals[id(r)]["gir"]),
+            "fewest_putts_in_round": _best_round_event(rounds_year, lambda r: round_totals[id(r)]["putts"], prefer_lower=True),
         },
     }
 
@@ -501,26 +509,26 @@ def notable_achievements(
 
     putting_milestones = {
         "lifetime": {
-            "fewest_putts_in_round": min([value for value in (r.get_total_putts() for r in rounds_list) if value is not None], default=None),
+            "fewest_putts_in_round": min([value for value in (round_totals[id(r)]["putts"] for r in rounds_list) if value is not None], default=None),
             "most_1_putts_in_round": _best_round_metric(rounds_list, lambda r: sum(1 for row in _achievement_hole_rows([r]) if row["putts"] == 1)),
             "most_3_putts_in_round": _best_round_metric(rounds_list, lambda r: sum(1 for row in _achievement_hole_rows([r]) if row["putts"] is not None and row["putts"] >= 3)),
         },
         "one_year": {
-            "fewest_putts_in_round": min([value for value in (r.get_total_putts() for r in rounds_year) if value is not None], default=None),
+            "fewest_putts_in_round": min([value for value in (round_totals[id(r)]["putts"] for r in rounds_year) if value is not None], default=None),
             "most_1_putts_in_round": _best_round_metric(rounds_year, lambda r: sum(1 for row in _achievement_hole_rows([r]) if row["putts"] == 1)),
             "most_3_putts_in_round": _best_round_metric(rounds_year, lambda r: sum(1 for row in _achievement_hole_rows([r]) if row["putts"] is not None and row["putts"] >= 3)),
         },
     }
     putting_milestones_events = {
         "lifetime": {
-            "fewest_putts_in_round": _best_round_event(rounds_list, lambda r: r.get_total_putts(), prefer_lower=True),
+            "fewest_putts_in_round": _best_round_event(rounds_list, lambda r: round_totals[id(r)]["putts"], prefer_lower=True),
             "most_1_putts_in_round": _best_round_event(rounds_list, lambda r: sum(1 for row in _achievement_hole_rows([r]) if row["putts"] == 1)),
             "most_3_putts_in_round": _best_round_event(
                 rounds_list, lambda r: sum(1 for row in _achievement_hole_rows([r]) if row["putts"] is not None and row["putts"] >= 3)
             ),
         },
         "one_year": {
-            "fewest_putts_in_round": _best_round_event(rounds_year, lambda r: r.get_total_putts(), prefer_lower=True),
+            "fewest_putts_in_round": _best_round_event(rounds_year, lambda r: round_totals[id(r)]["putts"], prefer_lower=True),
             "most_1_putts_in_round": _best_round_event(rounds_year, lambda r: sum(1 for row in _achievement_hole_rows([r]) if row["putts"] == 1)),
             "most_3_putts_in_round": _best_round_event(
                 rounds_year, lambda r: sum(1 for row in _achievement_hole_rows([r]) if row["putts"] is not None and row["putts"] >= 3)
@@ -530,7 +538,7 @@ def notable_achievements(
 
     def _first_round_with_putts_below(round_set: List[Round], threshold: int) -> Optional[Dict[str, str]]:
         for round_obj in sorted(round_set, key=lambda r: r.date or datetime.max):
-            total_putts = round_obj.get_total_putts()
+            total_putts = round_totals[id(round_obj)]["putts"]
             if total_putts is not None and total_putts < threshold:
                 return _milestone_event(round_obj)
         return None
@@ -549,7 +557,7 @@ def notable_achievements(
     for row in putting_breaks:
         achieved = row["achievement"]
         if achieved and achieved.get("date"):
-            dt = datetime.strptime(achieved["date"], "%Y/%m/%d")
+            dt = parse_date_short(achieved["date"])
             if dt >= cutoff:
                 putting_milestones_in_window += 1
 
@@ -558,14 +566,14 @@ def notable_achievements(
 
     def _first_round_reaching_gir(round_set: List[Round], threshold: int) -> Optional[Dict[str, str]]:
         for round_obj in sorted(round_set, key=lambda r: r.date or datetime.max):
-            total_gir = round_obj.get_total_gir()
+            total_gir = round_totals[id(round_obj)]["gir"]
             if total_gir is not None and total_gir >= threshold:
                 return _milestone_event(round_obj)
         return None
 
     def _round_gir_percentage(round_obj: Round) -> Optional[float]:
         holes = len(_valid_hole_scores(round_obj))
-        gir = round_obj.get_total_gir()
+        gir = round_totals[id(round_obj)]["gir"]
         if not holes or gir is None:
             return None
         return (gir / holes) * 100
@@ -580,13 +588,13 @@ def notable_achievements(
             }
         )
 
-    lifetime_gir_counts = [r.get_total_gir() for r in rounds_list if r.get_total_gir() is not None]
+    lifetime_gir_counts = [round_totals[id(r)]["gir"] for r in rounds_list if round_totals[id(r)]["gir"] is not None]
     lifetime_gir_pct = [_round_gir_percentage(r) for r in rounds_list]
     lifetime_gir_pct = [value for value in lifetime_gir_pct if value is not None]
 
     one_year_gir_candidates = []
     for round_obj in rounds_year:
-        gir = round_obj.get_total_gir()
+        gir = round_totals[id(round_obj)]["gir"]
         gir_pct = _round_gir_percentage(round_obj)
         if gir is not None and gir_pct is not None and round_obj.date is not None:
             one_year_gir_candidates.append((round_obj, gir, gir_pct))
@@ -606,7 +614,7 @@ def notable_achievements(
     for row in gir_breaks:
         achieved = row["achievement"]
         if achieved and achieved.get("date"):
-            dt = datetime.strptime(achieved["date"], "%Y/%m/%d")
+            dt = parse_date_short(achieved["date"])
             if dt >= cutoff:
                 gir_milestones_in_window += 1
 
@@ -626,7 +634,7 @@ def notable_achievements(
     gir_milestones_events = {
         "lifetime": {
             "highest_gir_percentage_in_round": _best_round_event(rounds_list, _round_gir_percentage),
-            "most_gir_in_round": _best_round_event(rounds_list, lambda r: r.get_total_gir()),
+            "most_gir_in_round": _best_round_event(rounds_list, lambda r: round_totals[id(r)]["gir"]),
         },
         "one_year": {
             "best_gir_round": best_gir_round_event,
@@ -655,17 +663,17 @@ def notable_achievements(
     for row in score_breaks:
         achieved = row["achievement"]
         if achieved and achieved.get("date"):
-            dt = datetime.strptime(achieved["date"], "%Y/%m/%d")
+            dt = parse_date_short(achieved["date"])
             if dt >= cutoff:
                 new_records.append(f"break_{row['threshold']}")
     if first_round_under_par and first_round_under_par.get("date"):
-        dt = datetime.strptime(first_round_under_par["date"], "%Y/%m/%d")
+        dt = parse_date_short(first_round_under_par["date"])
         if dt >= cutoff:
             new_records.append("first_round_under_par")
     for key in ("first_eagle", "first_hole_in_one"):
         achieved = round_milestones_lifetime[key]
         if achieved and achieved.get("date"):
-            dt = datetime.strptime(achieved["date"], "%Y/%m/%d")
+            dt = parse_date_short(achieved["date"])
             if dt >= cutoff:
                 new_records.append(key)
 
@@ -696,9 +704,10 @@ def round_summary(round_obj: Round) -> Dict[str, Optional[float]]:
     """Compute summary metrics for a single round."""
     hole_scores = _valid_hole_scores(round_obj)
     holes_played = len(hole_scores)
-    total_putts = round_obj.get_total_putts()
-    total_gir = round_obj.get_total_gir()
-    total_strokes = round_obj.calculate_total_score()
+    totals = round_obj.calculate_totals()
+    total_putts = totals["putts"]
+    total_gir = totals["gir"]
+    total_strokes = totals["total"]
 
     gir_percentage: Optional[float] = None
     putts_per_hole: Optional[float] = None
@@ -1321,12 +1330,14 @@ def scoring_vs_hole_handicap(rounds: Iterable[Round]) -> List[Dict[str, Any]]:
             if hole_score.hole_number is None or hole_score.strokes is None:
                 continue
 
-            par = round_obj.get_hole_par(hole_score.hole_number)
-            handicap = (
-                round_obj.course.get_hole(hole_score.hole_number).handicap
-                if round_obj.course
-                else hole_score.handicap_played
-            )
+            if round_obj.course:
+                # One course lookup for both par and handicap.
+                hole = round_obj.course.get_hole(hole_score.hole_number)
+                par = hole.par if hole else None
+                handicap = hole.handicap if hole else None
+            else:
+                par = round_obj.get_hole_par(hole_score.hole_number)
+                handicap = hole_score.handicap_played
             if par is None or handicap is None:
                 continue
 
@@ -92,6 +92,7 @@ class LinkCourseRequest(BaseModel):
 def summarize_round(r) -> RoundSummaryResponse:
     """Project a full Round model into a lightweight summary."""
     fairways = [s.fairway_hit for s in r.hole_scores if s.fairway_hit is not None]
+    totals = r.calculate_totals()
     return RoundSummaryResponse(
         id=r.id,
         course_id=str(r.course.id) if r.course and r.course.id else None,
@@ -100,12 +101,12 @@ def summarize_round(r) -> RoundSummaryResponse:
         course_par=r.get_par(),
         tee_box=r.tee_box,
         date=r.date,
-        total_score=r.calculate_total_score(),
+        total_score=totals["total"],
         to_par=r.total_to_par(),
-        front_nine=r.calculate_front_nine(),
-        back_nine=r.calculate_back_nine(),
-        total_putts=r.get_total_putts(),
-        total_gir=r.get_total_gir(),
+        front_nine=totals["front_nine"],
+        back_nine=totals["back_nine"],
+        total_putts=totals["putts"],
+        total_gir=totals["gir"],
         fairways_hit=sum(1 for f in fairways if f) if fairways else None,
         notes=r.notes,
     )
@@ -1,11 +1,13 @@
 """Scorecard scan/upload API endpoints."""
 
+import asyncio
 import contextlib
 import hashlib
 import logging
 import os
 import tempfile
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -20,8 +22,8 @@ from api.dependencies import get_current_user, get_optional_current_user, get_db
 from api.input_validation import ensure_uuid_str, normalize_course_display_name, sanitize_ocr_text, sanitize_user_text
 from api.request_models import SaveRoundRequest
 from models import User
-from services.gemini_table_merger import merge_split_tables
-from services.mistral_ocr_service import MistralOCRService
+from services.gemini_table_merger import GEMINI_MERGE_MODEL, merge_split_tables
+from services.mistral_ocr_service import DEFAULT_MISTRAL_OCR_MODEL, MistralOCRService
 from services.mistral_scorecard_parser import ParsedScorecardRows, parse_mistral_scorecard_rows
 from services.scan_service import ScanService
 
@@ -29,7 +31,7 @@ router = APIRouter()
 
 OCR_LONG_EDGE_TARGET = 1800
 OCR_JPEG_QUALITY = 75
-PREPROCESS_CACHE_VERSION = "v2"
+PREPROCESS_CACHE_VERSION = "v3"
 MAX_UPLOAD_BYTES = 20 * 1024 * 1024  # 20 MB
 MAX_OCR_TEXT_CHARS = 300_000
 MAX_USER_CONTEXT_CHARS = 1_500
@@ -37,7 +39,7 @@ MAX_IMAGE_PIXELS = 40_000_000
 MAX_IMAGE_SIDE = 12_000
 PREPROCESS_CACHE_DIR = Path(tempfile.gettempdir()) / "scanscore_ocr_cache"
 PREPROCESS_CACHE_ENABLED = False
-MISTRAL_OCR_MODEL = os.environ.get("MISTRAL_OCR_MODEL") or "mistral-ocr-latest"
+MISTRAL_OCR_MODEL = os.environ.get("MISTRAL_OCR_MODEL") or DEFAULT_MISTRAL_OCR_MODEL
 
 
 def _initialize_heic_decoder() -> bool:
@@ -89,6 +91,13 @@ def _env_bool(name: str, default: bool = False) -> bool:
 # Disabled by default to avoid leaking OCR/user content into aggregated logs.
 LOG_SENSITIVE_OCR_DEBUG = _env_bool("LOG_SENSITIVE_OCR_DEBUG", False)
 
+# In-process cache of merged OCR markdown keyed by upload content hash, so a
+# re-upload of the same card (retry, prefetch + extract) skips the provider
+# round trips. Kept in memory only; nothing is written to disk.
+OCR_RESULT_CACHE_ENABLED = _env_bool("OCR_RESULT_CACHE_ENABLED", True)
+OCR_RESULT_CACHE_MAX_ENTRIES = 64
+_ocr_result_cache: "OrderedDict[str, str]" = OrderedDict()
+
 
 class ScanResponse(BaseModel):
     """Response from scorecard extraction."""
@@ -148,66 +157,91 @@ def _validate_upload_payload(path: Path, suffix: str) -> None:
         raise HTTPException(400, "Invalid or unreadable image upload.") from exc
 
 
+_CONFIDENCE_LEVELS = ("very_low", "low", "medium", "high")
+
+
 def _confidence_level(score: float) -> str:
-    if score >= 0.85:
-        return "high"
-    if score >= 0.65:
-        return "medium"
-    if score >= 0.4:
-        return "low"
-    return "very_low"
+    # Each passed threshold bumps the index by one: <0.4, 0.4, 0.65, 0.85.
+    return _CONFIDENCE_LEVELS[(score >= 0.4) + (score >= 0.65) + (score >= 0.85)]
+
+
+def _scored(score: float) -> tuple[float, str]:
+    return score, _confidence_level(score)
+
+
+# Heuristic per-field confidence as (missing, present) pairs, classified once
+# at import instead of once per hole.
+_STROKES_CONFIDENCE = (_scored(0.2), _scored(0.9))
+_PUTTS_CONFIDENCE = (_scored(0.25), _scored(0.85))
+_GIR_CONFIDENCE = (_scored(0.3), _scored(0.8))
+_HOLE_OVERALL_CONFIDENCE = {
+    (has_strokes, has_putts): _scored(
+        min(_STROKES_CONFIDENCE[has_strokes][0], _PUTTS_CONFIDENCE[has_putts][0])
+    )
+    for has_strokes in (False, True)
+    for has_putts in (False, True)
+}
 
 
 def _build_confidence_payload(
     hole_scores: List[Dict],
     fields_needing_review: List[str],
-) -> Dict:
+) -> tuple[Dict, tuple[int, int, int]]:
+    """Build the review confidence payload.
+
+    Also returns how many holes have strokes, putts and GIR filled in, counted
+    in the same pass.
+    """
     hole_conf = []
     present = 0
+    present_putts = 0
+    present_gir = 0
     for hs in hole_scores:
         hole_num = hs.get("hole_number")
-        strokes = hs.get("strokes")
-        putts = hs.get("putts")
-        gir = hs.get("green_in_regulation")
-        strokes_conf = 0.9 if strokes is not None else 0.2
-        putts_conf = 0.85 if putts is not None else 0.25
-        gir_conf = 0.8 if gir is not None else 0.3
-        overall = min(strokes_conf, putts_conf)
-        if strokes is not None:
-            present += 1
+        has_strokes = hs.get("strokes") is not None
+        has_putts = hs.get("putts") is not None
+        strokes_conf, strokes_level = _STROKES_CONFIDENCE[has_strokes]
+        putts_conf, putts_level = _PUTTS_CONFIDENCE[has_putts]
+        has_gir = hs.get("green_in_regulation") is not None
+        gir_conf, gir_level = _GIR_CONFIDENCE[has_gir]
+        overall, overall_level = _HOLE_OVERALL_CONFIDENCE[has_strokes, has_putts]
+        present += has_strokes
+        present_putts += has_putts
+        present_gir += has_gir
         hole_conf.append(
             {
                 "hole_number": hole_num,
                 "fields": {
                     "strokes": {
                         "final_confidence": strokes_conf,
-                        "level": _confidence_level(strokes_conf),
+                        "level": strokes_level,
                         "validation_flags": [],
                     },
                     "putts": {
                         "final_confidence": putts_conf,
-                        "level": _confidence_level(putts_conf),
+                        "level": putts_level,
                         "validation_flags": [],
                     },
                     "green_in_regulation": {
                         "final_confidence": gir_conf,
-                        "level": _confidence_level(gir_conf),
+                        "level": gir_level,
                         "validation_flags": [],
                     },
                 },
                 "overall": overall,
-                "level": _confidence_level(overall),
+                "level": overall_level,
             }
         )
 
     overall = present / len(hole_scores) if hole_scores else 0.0
     # Penalize by unresolved warnings.
     overall = max(0.0, overall - min(0.5, len(fields_needing_review) * 0.02))
-    return {
+    payload = {
         "overall": overall,
         "level": _confidence_level(overall),
         "hole_scores": hole_conf,
     }
+    return payload, (present, present_putts, present_gir)
 
 
 def _build_round_from_parsed_rows(
@@ -220,6 +254,11 @@ def _build_round_from_parsed_rows(
         value = getattr(parsed, name, [])
         return value if isinstance(value, list) else []
 
+    def _fixed_row(values: List) -> List:
+        # Exactly hole_count slots, None-padded, in one allocation.
+        row = values[:hole_count]
+        return row + [None] * (hole_count - len(row))
+
     fields_needing_review: List[str] = list(parsed.warnings)
 
     known_course = course_model is not None
@@ -240,8 +279,13 @@ def _build_round_from_parsed_rows(
         model_holes = getattr(course_model, "holes", []) or []
         if model_holes:
             hole_count = min(18, len(model_holes))
+        # Index once instead of scanning model_holes for every hole number.
+        # First hole wins on duplicate numbers, matching the previous next() scan.
+        holes_by_number: Dict[int, object] = {}
+        for h in model_holes:
+            holes_by_number.setdefault(getattr(h, "number", None), h)
         for i in range(1, hole_count + 1):
-            hole_obj = next((h for h in model_holes if getattr(h, "number", None) == i), None)
+            hole_obj = holes_by_number.get(i)
             p = getattr(hole_obj, "par", None) if hole_obj is not None else None
             hcp = getattr(hole_obj, "handicap", None) if hole_obj is not None else None
             hole_par_lookup[i] = p
@@ -261,12 +305,10 @@ def _build_round_from_parsed_rows(
     else:
         # Unknown-course path uses parsed OCR rows.
         course_name = normalize_course_display_name(parsed.course_name) if parsed.course_name else None
-        parsed_pars = list(_safe_list_attr("par_row")[:hole_count])
-        while len(parsed_pars) < hole_count:
-            parsed_pars.append(None)
+        parsed_pars = _fixed_row(_safe_list_attr("par_row"))
+        handicap_row = _fixed_row(_safe_list_attr("handicap_row"))
         for i in range(1, hole_count + 1):
-            handicap_row = _safe_list_attr("handicap_row")
-            handicap = handicap_row[i - 1] if i - 1 < len(handicap_row) else None
+            handicap = handicap_row[i - 1]
             par_i = parsed_pars[i - 1]
             if par_i is not None and not (3 <= par_i <= 6):
                 par_i = None
@@ -290,24 +332,12 @@ def _build_round_from_parsed_rows(
                 }
             )
 
-    score_vals = list(_safe_list_attr("score_row")[:hole_count])
-    while len(score_vals) < hole_count:
-        score_vals.append(None)
-    putt_vals = list(_safe_list_attr("putts_row")[:hole_count])
-    while len(putt_vals) < hole_count:
-        putt_vals.append(None)
-    raw_putt_vals = list(_safe_list_attr("raw_putts_row")[:hole_count])
-    while len(raw_putt_vals) < hole_count:
-        raw_putt_vals.append(None)
-    gir_vals = list(_safe_list_attr("gir_row")[:hole_count])
-    while len(gir_vals) < hole_count:
-        gir_vals.append(None)
-    shots_vals = list(_safe_list_attr("shots_to_green_row")[:hole_count])
-    while len(shots_vals) < hole_count:
-        shots_vals.append(None)
-    raw_shots_vals = list(_safe_list_attr("raw_shots_to_green_row")[:hole_count])
-    while len(raw_shots_vals) < hole_count:
-        raw_shots_vals.append(None)
+    score_vals = _fixed_row(_safe_list_attr("score_row"))
+    putt_vals = _fixed_row(_safe_list_attr("putts_row"))
+    raw_putt_vals = _fixed_row(_safe_list_attr("raw_putts_row"))
+    gir_vals = _fixed_row(_safe_list_attr("gir_row"))
+    shots_vals = _fixed_row(_safe_list_attr("shots_to_green_row"))
+    raw_shots_vals = _fixed_row(_safe_list_attr("raw_shots_to_green_row"))
 
     effective_to_par = to_par_scoring if to_par_scoring is not None else (parsed.score_to_par_hint is True)
 
@@ -417,8 +447,41 @@ def _save_upload_to_temp(file: UploadFile, suffix: str) -> tuple[Path, str]:
         return Path(tmp.name), hasher.hexdigest()
 
 
-async def _run_ocr_pipeline(ocr_path: Path) -> str:
-    """Mistral OCR → Gemini merge → raw markdown string."""
+def _ocr_result_cache_key(upload_digest: str) -> str:
+    return (
+        f"{PREPROCESS_CACHE_VERSION}_le{OCR_LONG_EDGE_TARGET}_q{OCR_JPEG_QUALITY}"
+        f"_{MISTRAL_OCR_MODEL}_{GEMINI_MERGE_MODEL}_{upload_digest}"
+    )
+
+
+def _get_cached_ocr_markdown(upload_digest: str) -> Optional[str]:
+    if not OCR_RESULT_CACHE_ENABLED:
+        return None
+    key = _ocr_result_cache_key(upload_digest)
+    markdown = _ocr_result_cache.get(key)
+    if markdown is not None:
+        _ocr_result_cache.move_to_end(key)
+        logger.info("OCR result cache hit: chars=%d", len(markdown))
+    return markdown
+
+
+def _store_cached_ocr_markdown(upload_digest: str, markdown: str) -> None:
+    if not OCR_RESULT_CACHE_ENABLED or not markdown:
+        return
+    key = _ocr_result_cache_key(upload_digest)
+    _ocr_result_cache[key] = markdown
+    _ocr_result_cache.move_to_end(key)
+    while len(_ocr_result_cache) > OCR_RESULT_CACHE_MAX_ENTRIES:
+        _ocr_result_cache.popitem(last=False)
+
+
+async def _run_ocr_pipeline(ocr_path: Path, upload_digest: Optional[str] = None) -> str:
+    """Mistral OCR → Gemini merge → raw markdown string.
+
+    When *upload_digest* is given the result is cached under it. Callers look
+    the cache up themselves (_get_cached_ocr_markdown) before preprocessing,
+    so a hit skips the image work as well as both providers.
+    """
     svc = MistralOCRService()
     ocr_resp = await svc.ocr_file(ocr_path)
 
@@ -447,7 +510,12 @@ async def _run_ocr_pipeline(ocr_path: Path) -> str:
         logger.debug("Mistral raw markdown:\n%s", raw_markdown)
     else:
         logger.info("Mistral OCR produced markdown chars=%d", len(raw_markdown))
-    return await merge_split_tables(raw_markdown)
+    merged = await merge_split_tables(raw_markdown)
+    # The merger hands back the same object when it falls back to the
+    # unmerged input; don't pin that degraded result in the cache.
+    if upload_digest is not None and merged is not raw_markdown:
+        _store_cached_ocr_markdown(upload_digest, merged)
+    return merged
 
 
 def _get_preprocess_cache_path(upload_digest: str) -> Path:
@@ -482,6 +550,19 @@ def _normalize_upload_for_ocr(path: Path, upload_digest: str) -> tuple[Path, boo
     t0 = time.perf_counter()
     try:
         with Image.open(path) as img:
+            # Upload resolution as stored (before draft decoding and EXIF
+            # orientation), for the preprocess log line.
+            original_size = img.size
+            # Let libjpeg decode large phone photos at 1/2..1/8 scale instead of
+            # inflating the full 12MP frame only to LANCZOS it down afterwards.
+            # draft() never goes below the requested size, so the resize below
+            # still produces the exact target dimensions.
+            draft_scale = OCR_LONG_EDGE_TARGET / float(max(img.size))
+            if draft_scale < 0.5:
+                img.draft(
+                    "RGB",
+                    (int(img.size[0] * draft_scale) + 1, int(img.size[1] * draft_scale) + 1),
+                )
             t_open = time.perf_counter()
             if is_pdf:
                 # First page only for scorecard PDFs.
@@ -494,7 +575,6 @@ def _normalize_upload_for_ocr(path: Path, upload_digest: str) -> tuple[Path, boo
             if img.mode != "RGB":
                 img = img.convert("RGB")
             t_orient = time.perf_counter()
-            original_size = img.size
 
             # Resize large images before OCR (keep aspect ratio, do not upscale).
             width, height = img.size
@@ -566,8 +646,11 @@ async def prefetch_ocr(
     cache_hit = False
     try:
         _validate_upload_payload(original_tmp_path, suffix)
-        ocr_path, cache_hit = _normalize_upload_for_ocr(original_tmp_path, upload_digest)
-        markdown_text = await _run_ocr_pipeline(ocr_path)
+        # Check the result cache before preprocessing so a hit skips the image work too.
+        markdown_text = _get_cached_ocr_markdown(upload_digest)
+        if markdown_text is None:
+            ocr_path, cache_hit = _normalize_upload_for_ocr(original_tmp_path, upload_digest)
+            markdown_text = await _run_ocr_pipeline(ocr_path, upload_digest)
         logger.info("Prefetch OCR complete: user=%s chars=%d", getattr(current_user, "id", "anonymous"), len(markdown_text))
         return {"ocr_text": markdown_text}
     except HTTPException:
@@ -634,31 +717,53 @@ async def extract_scan(
     try:
         _validate_upload_payload(original_tmp_path, suffix)
 
-        t_pre_start = time.perf_counter()
-        ocr_path, cache_hit = _normalize_upload_for_ocr(original_tmp_path, upload_digest)
-        t_pre_end = time.perf_counter()
-        logger.info(
-            "Scan preprocessing complete: original=%s ocr_input=%s normalized=%s cache_enabled=%s cache_hit=%s pre_ms=%.1f",
-            original_tmp_path.name,
-            ocr_path.name,
-            ocr_path != original_tmp_path,
-            PREPROCESS_CACHE_ENABLED,
-            cache_hit,
-            (t_pre_end - t_pre_start) * 1000.0,
-        )
+        if not ocr_text:
+            # Same upload already OCR'd (e.g. by /ocr prefetch) — reuse it.
+            ocr_text = _get_cached_ocr_markdown(upload_digest)
+
+        # Preprocessing only feeds OCR; skip it when OCR text is already in hand.
+        if not ocr_text:
+            t_pre_start = time.perf_counter()
+            ocr_path, cache_hit = _normalize_upload_for_ocr(original_tmp_path, upload_digest)
+            t_pre_end = time.perf_counter()
+            logger.info(
+                "Scan preprocessing complete: original=%s ocr_input=%s normalized=%s cache_enabled=%s cache_hit=%s pre_ms=%.1f",
+                original_tmp_path.name,
+                ocr_path.name,
+                ocr_path != original_tmp_path,
+                PREPROCESS_CACHE_ENABLED,
+                cache_hit,
+                (t_pre_end - t_pre_start) * 1000.0,
+            )
 
         # Scoring format is inferred from row parser + user_context hints.
         to_par_scoring: Optional[bool] = None
 
+        # Start OCR before the course lookup so the two round trips overlap.
+        # Trade-off: a request that then fails the lookup (404) or the
+        # ownership check (403) has already started a paid Mistral call; the
+        # task is cancelled below, but the provider may still bill it.
+        t_extract_start = time.perf_counter()
+        ocr_task: Optional[asyncio.Task] = None
+        if not ocr_text:
+            ocr_task = asyncio.create_task(_run_ocr_pipeline(ocr_path, upload_digest))
+
         # Optional known course preload; extraction is always full Mistral parse.
         course_model = None
         t_course_lookup_start = time.perf_counter()
-        if course_id:
-            course_model = await db.courses.get_course(course_id)
-            if course_model is None:
-                raise HTTPException(404, f"Course {course_id} not found")
-            if course_model.user_id and (current_user is None or str(course_model.user_id) != str(current_user.id)):
-                raise HTTPException(403, "Forbidden")
+        try:
+            if course_id:
+                course_model = await db.courses.get_course(course_id)
+                if course_model is None:
+                    raise HTTPException(404, f"Course {course_id} not found")
+                if course_model.user_id and (current_user is None or str(course_model.user_id) != str(current_user.id)):
+                    raise HTTPException(403, "Forbidden")
+        except BaseException:
+            if ocr_task is not None:
+                ocr_task.cancel()
+                with contextlib.suppress(BaseException):
+                    await ocr_task
+            raise
         t_course_lookup_end = time.perf_counter()
         logger.info(
             "Scan stage complete: stage=course_lookup has_course_id=%s found=%s lookup_ms=%.1f",
@@ -666,13 +771,12 @@ async def extract_scan(
             course_model is not None,
             (t_course_lookup_end - t_course_lookup_start) * 1000.0,
         )
-        t_extract_start = time.perf_counter()
-        if ocr_text:
-            # Prefetch already ran OCR + Gemini merge — use it directly.
+        if ocr_task is None:
+            # Prefetch (or the result cache) already has OCR + Gemini merge — use it directly.
             markdown_text = ocr_text
             logger.info("Scan using prefetched OCR text: chars=%d", len(markdown_text))
         else:
-            markdown_text = await _run_ocr_pipeline(ocr_path)
+            markdown_text = await ocr_task
             logger.info(
                 "Scan OCR+merge complete: extract_ms=%.1f chars=%d",
                 (time.perf_counter() - t_extract_start) * 1000.0,
@@ -692,8 +796,8 @@ async def extract_scan(
             to_par_scoring=to_par_scoring,
         )
 
-        present_strokes = len(
-            [h for h in round_data.get("hole_scores", []) if h.get("strokes") is not None]
+        confidence_data, (present_strokes, present_putts, present_gir) = _build_confidence_payload(
+            round_data.get("hole_scores", []), fields_needing_review
         )
         if present_strokes == 0:
             if parsed_rows.player_name:
@@ -706,16 +810,15 @@ async def extract_scan(
                 "Unable to clearly read the score rows from this image. Please upload a cleaner image with clearer handwriting and better lighting, then try again.",
             )
 
-        confidence_data = _build_confidence_payload(round_data.get("hole_scores", []), fields_needing_review)
         t_parse_end = time.perf_counter()
         logger.info(
             "Scan stage complete: stage=mistral_parse extraction_mode=%s parse_ms=%.1f score_cells=%d putt_cells=%d gir_cells=%d shots_cells=%d to_par_hint=%s warnings=%d",
             parsed_rows.extraction_mode,
             (t_parse_end - t_parse_start) * 1000.0,
-            len([h for h in round_data.get("hole_scores", []) if h.get("strokes") is not None]),
-            len([h for h in round_data.get("hole_scores", []) if h.get("putts") is not None]),
-            len([h for h in round_data.get("hole_scores", []) if h.get("green_in_regulation") is not None]),
-            len([v for v in parsed_rows.shots_to_green_row if v is not None]),
+            present_strokes,
+            present_putts,
+            present_gir,
+            sum(v is not None for v in parsed_rows.shots_to_green_row),
             parsed_rows.score_to_par_hint is True,
             len(fields_needing_review),
         )
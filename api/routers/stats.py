@@ -30,19 +30,26 @@ async def get_dashboard(
     # Single aggregate query for all summary stats (no hole_score fetches)
     summaries = await db.rounds.get_round_summaries_for_user(str(user_id), limit=500, offset=0)
 
-    scores = [r["total_score"] for r in summaries if r["total_score"] is not None]
-    putts = [r["total_putts"] for r in summaries if r["total_putts"] is not None]
-    girs = [r["total_gir"] for r in summaries if r["total_gir"] is not None]
-
-    best_score = min(scores) if scores else None
+    # One pass for averages and the best round (first row wins on ties).
+    score_sum = score_count = putts_sum = putts_count = gir_sum = gir_count = 0
+    best_score = None
     best_round_id = None
     best_course = None
-    if best_score is not None:
-        for r in summaries:
-            if r["total_score"] == best_score:
+    for r in summaries:
+        total_score = r["total_score"]
+        if total_score is not None:
+            score_sum += total_score
+            score_count += 1
+            if best_score is None or total_score < best_score:
+                best_score = total_score
                 best_round_id = str(r["id"])
                 best_course = r["course_name"]
-                break
+        if r["total_putts"] is not None:
+            putts_sum += r["total_putts"]
+            putts_count += 1
+        if r["total_gir"] is not None:
+            gir_sum += r["total_gir"]
+            gir_count += 1
 
     # Build recent_rounds response objects from summaries (first 5)
     def _summary_to_response(row: dict) -> RoundSummaryResponse:
@@ -77,14 +84,14 @@ async def get_dashboard(
 
     return DashboardResponse(
         total_rounds=len(summaries),
-        scoring_average=round(sum(scores) / len(scores), 1) if scores else None,
+        scoring_average=round(score_sum / score_count, 1) if score_count else None,
         best_round=best_score,
         best_round_id=best_round_id,
         best_round_course=best_course,
         handicap_index=calculated_hi,
         recent_rounds=recent_rounds,
-        average_putts=round(sum(putts) / len(putts), 1) if putts else None,
-        average_gir=round(sum(girs) / len(girs), 1) if girs else None,
+        average_putts=round(putts_sum / putts_count, 1) if putts_count else None,
+        average_gir=round(gir_sum / gir_count, 1) if gir_count else None,
     )
 
 
@@ -308,7 +315,7 @@ async def get_analytics(
             },
         }
 
-    scores = [r.calculate_total_score() for r in rounds if r.calculate_total_score() is not None]
+    scores = [s for s in (r.calculate_total_score() for r in rounds) if s is not None]
     gir_data = analytics.overall_gir_percentage(rounds)
     putts_gir_data = analytics.overall_putts_per_gir(rounds)
     scrambling_rows = analytics.scrambling_per_round(rounds)
@@ -451,8 +458,10 @@ async def get_milestones(
     achievements = analytics.notable_achievements(rounds_chrono, home_course_id=user.home_course_id)
 
     def _parse_date(d: str) -> datetime:
+        # Dates come from analytics as unpadded "Y/M/D"; parse them with the
+        # same helper analytics uses. Missing/odd values sort last.
         try:
-            return datetime.strptime(d, "%Y/%m/%d")
+            return analytics.parse_date_short(d)
         except Exception:
             return datetime.min
 
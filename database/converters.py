@@ -8,6 +8,8 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from models import Course, Hole, Tee, HoleScore, Round, User, UserTee
 
 
@@ -15,6 +17,10 @@ from models import Course, Hole, Tee, HoleScore, Round, User, UserTee
 # Row -> Model (reads)
 # ================================================================
 
+# JSONB {"hole": yardage} text -> {int: int} in one jiter parse + coerce pass.
+_HOLE_YARDAGES_ADAPTER = TypeAdapter(Dict[int, int])
+
+
 def hole_from_row(row) -> Hole:
     """courses.holes row -> Hole model."""
     return Hole(
@@ -85,10 +91,22 @@ def round_from_rows(
     user_tee: Optional["UserTee"] = None,
 ) -> Round:
     """Assemble a Round from DB rows + pre-loaded Course."""
-    hole_scores = sorted(
+    return round_from_row(
+        round_row,
         [hole_score_from_row(r) for r in hole_score_rows],
-        key=lambda hs: hs.hole_number or 0,
+        course, tee_color, user_tee,
     )
+
+
+def round_from_row(
+    round_row,
+    hole_scores: List[HoleScore],
+    course: Optional[Course],
+    tee_color: Optional[str] = None,
+    user_tee: Optional["UserTee"] = None,
+) -> Round:
+    """Assemble a Round from a users.rounds row + already-built HoleScores."""
+    hole_scores = sorted(hole_scores, key=lambda hs: hs.hole_number or 0)
     return Round(
         id=str(round_row["id"]),
         course=course,
@@ -199,11 +217,11 @@ def user_to_row(user: User) -> dict:
 
 def user_tee_from_row(row) -> UserTee:
     """users.user_tees row -> UserTee model."""
-    import json as _json
     hole_yardages = row["hole_yardages"] or {}
     if isinstance(hole_yardages, str):
-        hole_yardages = _json.loads(hole_yardages)
-    # Keys come back as strings from JSONB; convert to int
+        hole_yardages = _HOLE_YARDAGES_ADAPTER.validate_json(hole_yardages)
+    # Keys come back as strings from JSONB; UserTee's Dict[int, int] field
+    # coerces them to int during validation.
     return UserTee(
         id=str(row["id"]),
         user_id=str(row["user_id"]),
@@ -211,7 +229,7 @@ def user_tee_from_row(row) -> UserTee:
         name=row["name"],
         slope_rating=float(row["slope_rating"]) if row["slope_rating"] else None,
         course_rating=float(row["course_rating"]) if row["course_rating"] else None,
-        hole_yardages={int(k): v for k, v in hole_yardages.items()},
+        hole_yardages=hole_yardages,
         created_at=row["created_at"],
     )
 
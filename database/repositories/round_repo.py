@@ -8,7 +8,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from models import HoleScore, Round
-from database.converters import round_from_rows, round_to_row, hole_score_to_row, user_tee_from_row, course_from_rows
+from database.converters import hole_score_from_row, round_from_row, round_from_rows, round_to_row, hole_score_to_row, user_tee_from_row, course_from_rows
 from database.exceptions import DuplicateError, IntegrityError, NotFoundError
 from database.repositories.course_repo import CourseRepositoryDB
 
@@ -44,22 +44,33 @@ class RoundRepositoryDB:
         )
         return row["id"] if row else None
 
-    async def _load_hole_id_map(self, conn, course_id: UUID) -> dict:
-        """Map hole_number -> hole UUID for a course."""
+    async def _load_hole_id_map(self, conn, course_id: UUID, hole_numbers: List[int]) -> dict:
+        """Map hole_number -> hole UUID for the given holes of a course."""
+        if not hole_numbers:
+            return {}
         rows = await conn.fetch(
-            "SELECT id, hole_number FROM courses.holes WHERE course_id = $1",
-            course_id,
+            """SELECT id, hole_number FROM courses.holes
+               WHERE course_id = $1 AND hole_number = ANY($2::int[])""",
+            course_id, hole_numbers,
         )
         return {r["hole_number"]: r["id"] for r in rows}
 
-    async def _assemble_round(self, conn, round_row) -> Round:
-        """Build a full Round model from a round row."""
+    async def _assemble_round(
+        self, conn, round_row, hole_scores: Optional[List[HoleScore]] = None
+    ) -> Round:
+        """Build a full Round model from a round row.
+
+        hole_scores may be passed when the caller already has them (e.g. it just
+        inserted them) to skip re-reading users.hole_scores.
+        """
         # Load hole scores
-        score_rows = await conn.fetch(
-            """SELECT * FROM users.hole_scores
-               WHERE round_id = $1 ORDER BY hole_number""",
-            round_row["id"],
-        )
+        if hole_scores is None:
+            score_rows = await conn.fetch(
+                """SELECT * FROM users.hole_scores
+                   WHERE round_id = $1 ORDER BY hole_number""",
+                round_row["id"],
+            )
+            hole_scores = [hole_score_from_row(r) for r in score_rows]
 
         # Load course if available
         course = None
@@ -81,7 +92,7 @@ class RoundRepositoryDB:
             if ut_row:
                 user_tee = user_tee_from_row(ut_row)
 
-        return round_from_rows(round_row, score_rows, course, tee_color, user_tee)
+        return round_from_row(round_row, hole_scores, course, tee_color, user_tee)
 
     async def _get_rounds_bulk(self, conn, round_rows) -> List[Round]:
         """Assemble N rounds in O(6) queries instead of O(N*4)."""
@@ -327,7 +338,8 @@ class RoundRepositoryDB:
                     hole_id_map = {}
                     if resolved_course_id:
                         hole_id_map = await self._load_hole_id_map(
-                            conn, resolved_course_id
+                            conn, resolved_course_id,
+                            [hs.hole_number for hs in round_.hole_scores if hs.hole_number is not None],
                         )
 
                     # Build par_by_hole from course holes for populating par_played
@@ -338,16 +350,21 @@ class RoundRepositoryDB:
                                 par_by_hole[h.number] = h.par
 
                     # Batch insert hole scores
+                    saved_scores = []
+                    score_tuples = []
                     if round_.hole_scores:
-                        score_tuples = []
                         for hs in round_.hole_scores:
                             hole_id = hole_id_map.get(hs.hole_number)
-                            # Populate par_played from course if available, else keep existing
+                            # Populate par_played from course if available, else keep existing.
+                            # Course pars are already validated (3-6), so copy
+                            # instead of a dump + full re-validation; the copy
+                            # also keeps the returned Round from sharing hole
+                            # scores with the caller's.
+                            update = None
                             if hs.hole_number in par_by_hole and hs.par_played is None:
-                                from models import HoleScore as _HS
-                                hs = _HS(
-                                    **{**hs.model_dump(), "par_played": par_by_hole[hs.hole_number]}
-                                )
+                                update = {"par_played": par_by_hole[hs.hole_number]}
+                            hs = hs.model_copy(update=update)
+                            saved_scores.append(hs)
                             score_tuples.append(hole_score_to_row(
                                 hs, new_round_id, hole_id
                             ))
@@ -361,10 +378,12 @@ class RoundRepositoryDB:
                                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)""",
                                 score_tuples,
                             )
-            # Transaction committed and connection released — now read back with a
-            # fresh connection so _assemble_round's get_course() doesn't compete
-            # for the same pool slot and deadlock.
-            return await self.get_round(str(new_round_id))
+            # Transaction committed and connection released — assemble from the
+            # RETURNING row and the HoleScores just written instead of
+            # re-selecting them, on a fresh connection so _assemble_round's
+            # get_course() doesn't compete for the same pool slot and deadlock.
+            async with self._pool.acquire() as conn:
+                return await self._assemble_round(conn, round_row, saved_scores)
         except asyncpg.UniqueViolationError as e:
             raise DuplicateError(str(e)) from e
         except asyncpg.ForeignKeyViolationError as e:
@@ -493,7 +512,10 @@ class RoundRepositoryDB:
             course_id = round_row["course_id"]
             hole_id_map = {}
             if course_id:
-                hole_id_map = await self._load_hole_id_map(conn, course_id)
+                hole_id_map = await self._load_hole_id_map(
+                    conn, course_id,
+                    [hs.hole_number for hs in hole_scores if hs.hole_number is not None],
+                )
 
             async with conn.transaction():
                 for hs in hole_scores:
@@ -10,5 +10,4 @@ from .user_tee import UserTee
 # Resolve forward refs like User.rounds -> Round once at import time.
 User.model_rebuild()
 
-__all__ = ["BaseGolfModel", "Course", "Hole", "HoleScore", "Round", "Tee", "User"]
 __all__ = ["BaseGolfModel", "Course", "Hole", "HoleScore", "Round", "Tee", "User", "UserTee"]
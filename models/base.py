@@ -1,5 +1,8 @@
 from pydantic import BaseModel, ConfigDict, ValidationError
-from typing import Any, Optional
+from typing import Any, Callable, List, Optional, TypeVar
+
+_T = TypeVar("_T")
+
 
 class BaseGolfModel(BaseModel):
     """Shared configuration and methods."""
@@ -11,4 +14,24 @@ class BaseGolfModel(BaseModel):
             setattr(self, field_name, value)
             return None
         except ValidationError as e:
-            return e.errors()[0]['msg']
\ No newline at end of file
+            return e.errors()[0]['msg']
+
+    def _indexed_lookup(
+        self, index_name: str, items: List[_T], key: Any, key_of: Callable[[_T], Any]
+    ) -> Optional[_T]:
+        """Find the item in *items* with key_of(item) == key via a cached index.
+
+        *index_name* names a cached_property mapping key -> position of the
+        first match when it was built. A hit is checked against the live list
+        and the index is rebuilt on a miss or stale hit, so reassigning the
+        list or editing items in place is picked up. Keys are expected to be
+        unique (the DB enforces it); with duplicates, which one is returned
+        after in-place edits is unspecified.
+        """
+        pos = getattr(self, index_name).get(key)
+        if pos is None or pos >= len(items) or key_of(items[pos]) != key:
+            self.__dict__.pop(index_name, None)
+            pos = getattr(self, index_name).get(key)
+            if pos is None:
+                return None
+        return items[pos]
@@ -1,5 +1,6 @@
+from functools import cached_property
 from pydantic import Field
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .base import BaseGolfModel
 from .hole import Hole
@@ -25,17 +26,33 @@ class Course(BaseGolfModel):
         """Get a tee by its color."""
         if not color:
             return None
-        for tee in self.tees:
-            if tee.color and tee.color.lower() == color.lower():
-                return tee
-        return None
+        return self._indexed_lookup(
+            "_tee_positions", self.tees, color.lower(),
+            lambda tee: (tee.color or "").lower(),
+        )
 
     def get_hole(self, number: int) -> Optional[Hole]:
         """Get a hole by its number (1-18)."""
-        for hole in self.holes:
-            if hole.number == number:
-                return hole
-        return None
+        return self._indexed_lookup(
+            "_hole_positions", self.holes, number, lambda hole: hole.number
+        )
+
+    @cached_property
+    def _tee_positions(self) -> Dict[str, int]:
+        """Lowercased color -> index of the first matching tee."""
+        positions: Dict[str, int] = {}
+        for i, tee in enumerate(self.tees):
+            if tee.color:
+                positions.setdefault(tee.color.lower(), i)
+        return positions
+
+    @cached_property
+    def _hole_positions(self) -> Dict[int, int]:
+        """Hole number -> index of the first matching hole."""
+        positions: Dict[int, int] = {}
+        for i, hole in enumerate(self.holes):
+            positions.setdefault(hole.number, i)
+        return positions
 
     def get_par(self) -> Optional[int]:
         """Get par - uses provided value or calculates from holes."""
@@ -46,22 +63,49 @@ class Course(BaseGolfModel):
     @property
     def calculated_par(self) -> Optional[int]:
         """Calculate total par from holes."""
-        if len(self.holes) != 18 or any(h.par is None for h in self.holes):
-            return None
-        return sum(h.par for h in self.holes if h.par is not None)
+        return self._par_totals()[2]
 
     @property
     def front_nine_par(self) -> Optional[int]:
         """Calculate par for holes 1-9."""
-        front = [h for h in self.holes if h.number is not None and 1 <= h.number <= 9]
-        if len(front) < 9 or any(h.par is None for h in front):
-            return None
-        return sum(h.par for h in front if h.par is not None)
+        return self._par_totals()[0]
 
     @property
     def back_nine_par(self) -> Optional[int]:
         """Calculate par for holes 10-18."""
-        back = [h for h in self.holes if h.number is not None and 10 <= h.number <= 18]
-        if len(back) < 9 or any(h.par is None for h in back):
-            return None
-        return sum(h.par for h in back if h.par is not None)
+        return self._par_totals()[1]
+
+    def _par_totals(self) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """(front, back, total) par in a single pass over holes.
+
+        Not cached: holes are routinely edited in place after construction.
+        """
+        front = back = total = 0
+        front_n = back_n = 0
+        front_ok = back_ok = all_ok = True
+        for h in self.holes:
+            par = h.par
+            if par is None:
+                all_ok = False
+            else:
+                total += par
+            number = h.number
+            if number is None:
+                continue
+            if 1 <= number <= 9:
+                front_n += 1
+                if par is None:
+                    front_ok = False
+                else:
+                    front += par
+            elif 10 <= number <= 18:
+                back_n += 1
+                if par is None:
+                    back_ok = False
+                else:
+                    back += par
+        return (
+            front if front_ok and front_n >= 9 else None,
+            back if back_ok and back_n >= 9 else None,
+            total if all_ok and len(self.holes) == 18 else None,
+        )
@@ -3,6 +3,17 @@ from typing import Optional
 
 from .base import BaseGolfModel
 
+# Score relative to par -> name; <= -3 and >= +5 are handled before lookup.
+_SCORE_NAMES = {
+    -2: "eagle",
+    -1: "birdie",
+    0: "par",
+    1: "bogey",
+    2: "double bogey",
+    3: "triple bogey",
+    4: "quadruple bogey",
+}
+
 
 class HoleScore(BaseGolfModel):
     """Represents a player's score on a single hole (raw scanned data)."""
@@ -18,9 +29,12 @@ class HoleScore(BaseGolfModel):
 
     @model_validator(mode='after')
     def validate_score_consistency(self):
-        if self.putts is not None and self.strokes is not None:
-            if self.putts > self.strokes:
-                raise ValueError(f"Putts ({self.putts}) cannot exceed strokes ({self.strokes})")
+        putts = self.putts
+        if putts is None:
+            return self
+        strokes = self.strokes
+        if strokes is not None and putts > strokes:
+            raise ValueError(f"Putts ({putts}) cannot exceed strokes ({strokes})")
         return self
 
     def to_par(self, par: Optional[int] = None) -> Optional[int]:
@@ -37,19 +51,8 @@ class HoleScore(BaseGolfModel):
         relative = self.to_par(par)
         if relative is None:
             return None
-
-        score_names = {
-            -3: "albatross",
-            -2: "eagle",
-            -1: "birdie",
-            0: "par",
-            1: "bogey",
-            2: "double bogey",
-            3: "triple bogey",
-            4: "quadruple bogey",
-        }
         if relative <= -3:
             return "albatross"
         if relative >= 5:
             return "5+ over"
-        return score_names.get(relative)
\ No newline at end of file
+        return _SCORE_NAMES[relative]
\ No newline at end of file
@@ -1,6 +1,7 @@
 from datetime import datetime
+from functools import cached_property
 from pydantic import Field
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, TypedDict, Union
 
 from .base import BaseGolfModel
 from .course import Course
@@ -9,6 +10,15 @@ from .tee import Tee
 from .user_tee import UserTee
 
 
+class RoundTotals(TypedDict):
+    """Per-round sums returned by Round.calculate_totals()."""
+    total: Optional[int]
+    front_nine: Optional[int]
+    back_nine: Optional[int]
+    putts: Optional[int]
+    gir: Optional[int]
+
+
 class Round(BaseGolfModel):
     """Represents a round of golf played by a user."""
     id: Optional[str] = None
@@ -40,47 +50,129 @@ class Round(BaseGolfModel):
         Returns None if any scored hole is missing putts (partial sums are misleading)."""
         if self.total_putts is not None:
             return self.total_putts
-        scored = [s for s in self.hole_scores if s.strokes is not None]
-        if not scored or any(s.putts is None for s in scored):
-            return None
-        return sum(s.putts for s in scored)  # type: ignore[misc]
+        putts = 0
+        any_scored = missing = False
+        for s in self.hole_scores:
+            if s.strokes is None:
+                continue
+            any_scored = True
+            if s.putts is None:
+                missing = True
+                break
+            putts += s.putts
+        return self._putts_total(putts, any_scored, missing)
 
     def get_total_gir(self) -> Optional[int]:
         """Get total GIR - uses provided value or calculates from holes."""
         if self.total_gir is not None:
             return self.total_gir
-        girs = [s.green_in_regulation for s in self.hole_scores
-                if s.green_in_regulation is not None]
-        return sum(girs) if girs else None
+        total = 0
+        any_gir = False
+        for s in self.hole_scores:
+            if s.green_in_regulation is not None:
+                total += s.green_in_regulation
+                any_gir = True
+        return total if any_gir else None
 
     def calculate_total_score(self) -> Optional[int]:
         """Calculate total strokes for the round."""
-        strokes = [s.strokes for s in self.hole_scores if s.strokes is not None]
-        return sum(strokes) if strokes else None
+        total = 0
+        any_scored = False
+        for s in self.hole_scores:
+            if s.strokes is not None:
+                total += s.strokes
+                any_scored = True
+        return total if any_scored else None
 
     def calculate_front_nine(self) -> Optional[int]:
         """Calculate total strokes for holes 1-9."""
-        front = [s for s in self.hole_scores if s.hole_number is not None and 1 <= s.hole_number <= 9]
-        strokes = [s.strokes for s in front if s.strokes is not None]
-        return sum(strokes) if strokes else None
+        return self._sum_strokes(1, 9)
 
     def calculate_back_nine(self) -> Optional[int]:
         """Calculate total strokes for holes 10-18."""
-        back = [s for s in self.hole_scores if s.hole_number is not None and 10 <= s.hole_number <= 18]
-        strokes = [s.strokes for s in back if s.strokes is not None]
-        return sum(strokes) if strokes else None
+        return self._sum_strokes(10, 18)
+
+    def _sum_strokes(self, first: int, last: int) -> Optional[int]:
+        total = 0
+        any_scored = False
+        for s in self.hole_scores:
+            n = s.hole_number
+            if s.strokes is None or n is None or not first <= n <= last:
+                continue
+            total += s.strokes
+            any_scored = True
+        return total if any_scored else None
+
+    def _putts_total(self, putts: int, any_scored: bool, missing: bool) -> Optional[int]:
+        """Apply the total_putts override and the missing-putts rule to a hole sum."""
+        if self.total_putts is not None:
+            return self.total_putts
+        if not any_scored or missing:
+            return None
+        return putts
+
+    def calculate_totals(self) -> RoundTotals:
+        """All per-round sums in one pass over hole_scores.
+
+        Use this when several metrics are needed for the same round; the
+        single-metric accessors above are cheaper when only one is.
+        """
+        total = front = back = putts = gir = 0
+        any_total = any_front = any_back = any_gir = missing_putts = False
+        for s in self.hole_scores:
+            g = s.green_in_regulation
+            if g is not None:
+                gir += g
+                any_gir = True
+            strokes = s.strokes
+            if strokes is None:
+                continue
+            total += strokes
+            any_total = True
+            if s.putts is None:
+                missing_putts = True
+            else:
+                putts += s.putts
+            n = s.hole_number
+            if n is not None:
+                if 1 <= n <= 9:
+                    front += strokes
+                    any_front = True
+                elif 10 <= n <= 18:
+                    back += strokes
+                    any_back = True
+        return RoundTotals(
+            total=total if any_total else None,
+            front_nine=front if any_front else None,
+            back_nine=back if any_back else None,
+            putts=self._putts_total(putts, any_total, missing_putts),
+            gir=self.total_gir if self.total_gir is not None else (gir if any_gir else None),
+        )
 
     def is_complete(self) -> bool:
         """Check if all holes have scores."""
         if not self.hole_scores:
             return False
         expected = 18 if len(self.hole_scores) > 9 else 9
-        valid_scores = [s for s in self.hole_scores if s.strokes is not None]
-        return len(valid_scores) == expected
+        filled = 0
+        for s in self.hole_scores:
+            if s.strokes is not None:
+                filled += 1
+        return filled == expected
 
     def get_hole_score(self, hole_number: int) -> Optional[HoleScore]:
         """Get score for a specific hole."""
-        return next((s for s in self.hole_scores if s.hole_number == hole_number), None)
+        return self._indexed_lookup(
+            "_score_positions", self.hole_scores, hole_number, lambda s: s.hole_number
+        )
+
+    @cached_property
+    def _score_positions(self) -> Dict[int, int]:
+        """Hole number -> index of the first matching hole score."""
+        positions: Dict[int, int] = {}
+        for i, s in enumerate(self.hole_scores):
+            positions.setdefault(s.hole_number, i)
+        return positions
 
     def get_hole_par(self, hole_number: int) -> Optional[int]:
         """Get par for a specific hole — from course, or par_played on the hole score."""
@@ -94,8 +186,13 @@ class Round(BaseGolfModel):
         """Get course par — from course, or calculated from par_played on hole scores."""
         if self.course:
             return self.course.get_par()
-        pars = [hs.par_played for hs in self.hole_scores if hs.par_played is not None]
-        return sum(pars) if pars else None
+        total = 0
+        any_par = False
+        for hs in self.hole_scores:
+            if hs.par_played is not None:
+                total += hs.par_played
+                any_par = True
+        return total if any_par else None
 
     def score_to_par(self, hole_number: int) -> Optional[int]:
         """Get score relative to par for a specific hole."""
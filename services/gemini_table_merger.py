@@ -12,12 +12,18 @@ Gemini call fails, so the pipeline degrades gracefully.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
 
 logger = logging.getLogger(__name__)
 
 GEMINI_MERGE_MODEL = "gemini-3.1-flash-lite-preview"
+# A merged 22-column scorecard is ~2k tokens; the cap only stops a runaway
+# (repeating) generation from holding the scan request until the timeout.
+# Thinking tokens count against it on Gemini 3 models, so thinking is pinned
+# to MINIMAL below (the merge is a copy/align task) to keep the cap for output.
+GEMINI_MERGE_MAX_OUTPUT_TOKENS = 8192
 
 _MERGE_PROMPT = """\
 Your task is to merge the following golf scorecard fragments into a single, comprehensive Markdown table.
@@ -46,6 +52,34 @@ REQUIRED STRUCTURE EXAMPLE:
 DATA TO MERGE:
 {markdown}
 """
+# Split once so each call is a plain concatenation instead of re-parsing the
+# whole template through str.format.
+_MERGE_PROMPT_HEAD, _, _MERGE_PROMPT_TAIL = _MERGE_PROMPT.partition("{markdown}")
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str):
+    """Return a shared genai client per API key (keeps its HTTP pool warm)."""
+    from google import genai  # imported lazily so missing package doesn't break startup
+
+    return genai.Client(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _merge_generate_config():
+    """Build the static GenerateContentConfig once; it never varies per call."""
+    from google.genai import types
+
+    return types.GenerateContentConfig(
+        temperature=0,
+        max_output_tokens=GEMINI_MERGE_MAX_OUTPUT_TOKENS,
+        thinking_config=types.ThinkingConfig(
+            thinking_level=types.ThinkingLevel.MINIMAL
+        ),
+        automatic_function_calling=types.AutomaticFunctionCallingConfig(
+            disable=True
+        ),
+    )
 
 
 async def merge_split_tables(markdown: str) -> str:
@@ -56,24 +90,21 @@ async def merge_split_tables(markdown: str) -> str:
         return markdown
 
     try:
-        from google import genai  # imported lazily so missing package doesn't break startup
-
-        client = genai.Client(api_key=api_key)
-        prompt = _MERGE_PROMPT.format(markdown=markdown)
-        from google.genai import types
+        client = _get_client(api_key)
+        prompt = _MERGE_PROMPT_HEAD + markdown + _MERGE_PROMPT_TAIL
         response = await asyncio.wait_for(
             client.aio.models.generate_content(
                 model=GEMINI_MERGE_MODEL,
                 contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0,
-                    automatic_function_calling=types.AutomaticFunctionCallingConfig(
-                        disable=True
-                    ),
-                ),
+                config=_merge_generate_config(),
             ),
             timeout=60,
         )
+        candidates = response.candidates or []
+        if candidates and candidates[0].finish_reason == "MAX_TOKENS":
+            logger.warning("Gemini table merge hit the output token cap; using original")
+            return markdown
+
         merged = (response.text or "").strip()
         # Strip accidental code fences Gemini sometimes adds
         if merged.startswith("```"):
@@ -6,6 +6,8 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
+from services.http_json import response_json
+
 _GOLF_STOP_WORDS = re.compile(r"\b(golf|course|club|country|links|gc|cc)\b")
 
 
@@ -74,7 +76,7 @@ class GolfCourseAPIService:
             try:
                 resp = await client.get(path, headers=headers, params=params)
                 resp.raise_for_status()
-                data = resp.json()
+                data = response_json(resp)
                 items = self._extract_items(data)
                 return self._normalize_items(items, limit=limit)
             except Exception as exc:  # noqa: BLE001
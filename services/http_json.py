@@ -0,0 +1,21 @@
+"""Shared JSON decoding for the httpx-based API clients."""
+
+from typing import Any
+
+import httpx
+
+try:
+    import orjson
+except Exception:  # noqa: BLE001
+    orjson = None
+
+
+def response_json(resp: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+
+    OCR pages and course search results are large, and orjson decodes them
+    several times faster than the stdlib json behind Response.json().
+    """
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
@@ -5,19 +5,28 @@ from __future__ import annotations
 import base64
 import logging
 import mimetypes
+import mmap
 import os
 from html.parser import HTMLParser
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import httpx
+
 try:
     from bs4 import BeautifulSoup
 except Exception:  # noqa: BLE001
     BeautifulSoup = None
 
+from services.http_json import response_json
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_MISTRAL_OCR_MODEL = "mistral-ocr-latest"
+
+_MD_ROW = "| {} |".format
+_join_cells = " | ".join
+
 
 class MistralOCRService:
     """Thin wrapper around Mistral OCR API.
@@ -41,7 +50,7 @@ class MistralOCRService:
         self._api_key = api_key or os.environ.get("MISTRAL_API_KEY")
         self._base_url = (base_url or os.environ.get("MISTRAL_BASE_URL") or "https://api.mistral.ai").rstrip("/")
         self._ocr_path = ocr_path or os.environ.get("MISTRAL_OCR_PATH") or "/v1/ocr"
-        self._model = model or os.environ.get("MISTRAL_OCR_MODEL") or "mistral-ocr-latest"
+        self._model = model or os.environ.get("MISTRAL_OCR_MODEL") or DEFAULT_MISTRAL_OCR_MODEL
         self._timeout = timeout_seconds
 
     async def ocr_file(
@@ -84,15 +93,21 @@ class MistralOCRService:
             try:
                 resp = await client.post(path_part, headers=headers, json=payload)
                 resp.raise_for_status()
-                return resp.json()
+                return response_json(resp)
             except Exception as exc:  # noqa: BLE001
                 raise RuntimeError(f"Mistral OCR failed: {exc}") from exc
 
     def _build_data_url(self, path: Path) -> str:
         mime_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
-        raw = path.read_bytes()
-        b64 = base64.b64encode(raw).decode("ascii")
-        return f"data:{mime_type};base64,{b64}"
+        # Encode straight from a read-only mapping (no bytes copy of the file)
+        # and decode once, instead of building an intermediate b64 str.
+        with open(path, "rb") as fh:
+            try:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    b64 = base64.b64encode(mapped)
+            except ValueError:  # empty files cannot be mapped
+                b64 = b""
+        return (f"data:{mime_type};base64,".encode("ascii") + b64).decode("ascii")
 
     @staticmethod
     def extract_markdown_text(ocr_response: Dict[str, Any]) -> str:
@@ -188,7 +203,7 @@ class MistralOCRService:
         if not rows:
             return ""
         return "\n".join(
-            "| " + " | ".join(cell.replace("|", "/") for cell in row) + " |"
+            _MD_ROW(_join_cells([cell.replace("|", "/") for cell in row]))
             for row in rows
         )
 
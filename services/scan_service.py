@@ -157,8 +157,9 @@ class ScanService:
         text = (value or "").strip().lower()
         if not text:
             return None
+        words = set(text.split())
         for token in _TEE_COLOR_TOKENS:
-            if token in text.split():
+            if token in words:
                 return token
             if f"{token} " in text or f" {token}" in text:
                 return token
@@ -188,10 +189,10 @@ class ScanService:
     ) -> Tuple[float, int]:
         if not incoming or not existing:
             return 0.0, 0
-        overlap = sorted(set(incoming.keys()) & set(existing.keys()))
+        overlap = incoming.keys() & existing.keys()
         if not overlap:
             return 0.0, 0
-        similar = sum(1 for h in overlap if abs(int(incoming[h]) - int(existing[h])) <= tolerance_yards)
+        similar = sum(1 for h in overlap if abs(incoming[h] - existing[h]) <= tolerance_yards)
         return similar / len(overlap), len(overlap)
 
     def _best_matching_course_tee_color(
@@ -208,10 +209,8 @@ class ScanService:
         for course_tee in course.tees or []:
             if not course_tee.color:
                 continue
-            ratio, overlap = self._tee_yardage_similarity(
-                incoming,
-                {int(h): int(y) for h, y in (course_tee.hole_yardages or {}).items()},
-            )
+            # Tee.hole_yardages is already validated as Dict[int, int].
+            ratio, overlap = self._tee_yardage_similarity(incoming, course_tee.hole_yardages or {})
             if ratio > best_ratio or (ratio == best_ratio and overlap > best_overlap):
                 best_ratio = ratio
                 best_overlap = overlap
@@ -362,9 +361,10 @@ class ScanService:
         tees: List[TeeInput],
     ) -> None:
         """Fill null fields on an existing course from scan data (fill-only, never overwrites)."""
-        for t in tees:
+        for i, t in enumerate(tees):
+            # Hole par/handicap don't depend on the tee; patch them on the first call only.
             await self._db.courses.fill_course_gaps(
-                course_id, scan_holes,
+                course_id, scan_holes if i == 0 else [],
                 t.color, t.slope_rating, t.course_rating, t.hole_yardages,
             )
 
@@ -156,6 +156,23 @@ def test_user_tee_converter_roundtrip():
     assert ut.hole_yardages == {1: 400, 9: 350}   # keys converted to int
 
 
+def test_user_tee_converter_parses_jsonb_text():
+    """Without a JSONB codec asyncpg returns text; it should decode to int keys."""
+    row = {
+        "id": uuid4(),
+        "user_id": uuid4(),
+        "course_id": None,
+        "name": "My Tee",
+        "slope_rating": None,
+        "course_rating": None,
+        "hole_yardages": '{"1": 400, "9": 350}',
+        "created_at": None,
+    }
+    ut = user_tee_from_row(row)
+
+    assert ut.hole_yardages == {1: 400, 9: 350}
+
+
 def test_user_converter_maps_friend_code():
     """user_from_row should map friend_code from users.users."""
     uid = uuid4()
@@ -218,25 +235,31 @@ async def test_course_repo_create_course(mock_pool):
     conn.transaction.return_value.__aenter__.return_value = AsyncMock()
 
     course_id = uuid4()
-    tee_id = uuid4()
+    red_id, blue_id = uuid4(), uuid4()
     conn.fetchrow.side_effect = [
         {"id": course_id, "name": "New Course", "location": "Loc",
          "external_course_id": None,
          "par": 72, "total_holes": 18, "metadata": "{}", "user_id": None},
-        {"id": tee_id},
     ]
+    conn.fetchmany.return_value = [{"id": red_id}, {"id": blue_id}]  # tees RETURNING id
     conn.fetch.side_effect = [
         [],  # holes (assembly)
         [],  # tees  (assembly)
     ]
 
     course = Course(name="New Course", location="Loc",
-                    holes=[Hole(number=1, par=4)], tees=[Tee(color="Red")])
+                    holes=[Hole(number=1, par=4)],
+                    tees=[Tee(color="Red", hole_yardages={1: 300}),
+                          Tee(color="Blue", hole_yardages={1: 350, 2: 410})])
     saved = await repo.create_course(course)
 
     assert saved.name == "New Course"
-    # Verify holes were inserted via executemany
-    conn.executemany.assert_called()
+    # Holes, tees and yardages each go in as a single batch
+    conn.fetchmany.assert_called_once()
+    assert len(conn.fetchmany.call_args[0][1]) == 2
+    assert conn.executemany.call_count == 2
+    _, yardages = conn.executemany.call_args[0]
+    assert yardages == [(red_id, 1, 300), (blue_id, 1, 350), (blue_id, 2, 410)]
 
 
 @pytest.mark.asyncio
@@ -366,9 +389,8 @@ async def test_round_repo_create_round_no_course(mock_pool):
 
     round_id = uuid4()
     row = _round_row(round_id, course_name_played="New Round")
-    # fetchrow called twice: INSERT round, then SELECT in get_round
-    conn.fetchrow.side_effect = [row, row]
-    conn.fetch.return_value = []  # hole_scores in _assemble_round
+    # fetchrow called once: INSERT ... RETURNING (no re-SELECT afterwards)
+    conn.fetchrow.side_effect = [row]
 
     r = Round(
         hole_scores=[HoleScore(hole_number=1, strokes=4, par_played=4)],
@@ -378,6 +400,10 @@ async def test_round_repo_create_round_no_course(mock_pool):
 
     assert saved is not None
     assert saved.course_name_played == "New Round"
+    # Hole scores come from the rows just inserted, not a re-read.
+    conn.fetch.assert_not_called()
+    assert [(hs.hole_number, hs.strokes) for hs in saved.hole_scores] == [(1, 4)]
+    assert saved.hole_scores[0] is not r.hole_scores[0]
 
     # Verify the hole score INSERT included par_played (11 columns, $10 = par_played)
     conn.executemany.assert_called_once()
@@ -403,14 +429,13 @@ async def test_round_repo_create_round_populates_par_from_course(mock_pool):
     course_id = uuid4()
 
     row = _round_row(round_id, course_id=course_id)
-    conn.fetchrow.side_effect = [row, row]
+    conn.fetchrow.side_effect = [row]
     conn.fetch.side_effect = [
         [{"id": hole_id, "hole_number": 1}],  # _load_hole_id_map
-        [],                                     # hole_scores in _assemble_round
     ]
 
     course = Course(id=str(course_id), name="Test", holes=[Hole(number=1, par=4)])
-    # get_round (called after insert) assembles a Round via course_repo.get_course;
+    # The saved Round is assembled via course_repo.get_course;
     # return None so it doesn't try to validate an AsyncMock as a Course.
     course_repo_mock.get_course = AsyncMock(return_value=None)
 
@@ -424,6 +449,9 @@ async def test_round_repo_create_round_populates_par_from_course(mock_pool):
     sql, tuples = conn.executemany.call_args[0]
     assert tuples[0][1] == hole_id  # hole_id resolved from map
     assert tuples[0][9] == 4        # par_played populated from course.holes
+    assert saved.hole_scores[0].par_played == 4
+    # Only the holes being inserted are looked up.
+    assert conn.fetch.call_args_list[0][0][2] == [1]
 
 
 # ================================================================
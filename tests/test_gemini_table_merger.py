@@ -0,0 +1,48 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+merger = pytest.importorskip("services.gemini_table_merger")
+types = pytest.importorskip("google.genai.types")
+
+
+class _FakeModels:
+    def __init__(self, response):
+        self.response = response
+        self.config = None
+
+    async def generate_content(self, *, model, contents, config):
+        self.config = config
+        return self.response
+
+
+@pytest.fixture
+def fake_gemini(monkeypatch):
+    def _install(finish_reason, text):
+        response = SimpleNamespace(
+            candidates=[SimpleNamespace(finish_reason=finish_reason)],
+            text=text,
+        )
+        models = _FakeModels(response)
+        client = SimpleNamespace(aio=SimpleNamespace(models=models))
+        monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+        monkeypatch.setattr(merger, "_get_client", lambda api_key: client)
+        return models
+
+    return _install
+
+
+def test_merge_returns_merged_table(fake_gemini):
+    models = fake_gemini(types.FinishReason.STOP, "```\n| HOLE | 1 |\n```")
+
+    assert asyncio.run(merger.merge_split_tables("| HOLE |\n| 1 |")) == "| HOLE | 1 |"
+    assert models.config.max_output_tokens == merger.GEMINI_MERGE_MAX_OUTPUT_TOKENS
+    assert models.config.thinking_config.thinking_level == types.ThinkingLevel.MINIMAL
+
+
+def test_merge_falls_back_to_original_when_output_is_truncated(fake_gemini):
+    fake_gemini(types.FinishReason.MAX_TOKENS, "| HOLE | 1 | 2 | 3 | 3 | 3 | 3")
+
+    original = "| HOLE |\n| 1 |"
+    assert asyncio.run(merger.merge_split_tables(original)) == original
@@ -87,6 +87,34 @@ def test_course_lookups():
     assert course.get_tee("Red") is None
 
 
+def test_course_lookups_follow_mutation():
+    course = Course(
+        holes=[Hole(number=1, par=4), Hole(number=2, par=3)],
+        tees=[Tee(color="Blue", slope_rating=120), Tee(color="blue", slope_rating=130)],
+    )
+    assert course.get_tee("BLUE").slope_rating == 120  # first match wins
+    assert course.get_hole(2).par == 3
+
+    course.tees[0].color = "Red"
+    assert course.get_tee("blue").slope_rating == 130
+    assert course.get_tee("red").slope_rating == 120
+
+    course.holes = [Hole(number=2, par=5)]
+    assert course.get_hole(1) is None
+    assert course.get_hole(2).par == 5
+
+
+def test_course_lookup_with_duplicate_numbers_returns_a_match():
+    # Duplicate numbers are invalid data (unique in the DB); after in-place
+    # edits a lookup still returns a matching hole, just not necessarily the
+    # first one in list order.
+    course = Course(holes=[Hole(number=5, par=3), Hole(number=1, par=4)])
+    assert course.get_hole(1).par == 4
+    course.holes[0] = Hole(number=1, par=5)
+    assert course.get_hole(1).number == 1
+    assert course.get_hole(5) is None
+
+
 # ================================================================
 # HoleScore
 # ================================================================
@@ -163,6 +191,25 @@ def test_round_property_aggregations():
     assert r.get_total_putts() == 3
     assert r.get_total_gir() == 1
     assert not r.is_complete()
+    assert r.calculate_totals() == {
+        "total": 9, "front_nine": 9, "back_nine": None, "putts": 3, "gir": 1,
+    }
+
+
+def test_round_totals_overrides_and_missing_putts():
+    scores = [
+        HoleScore(hole_number=1, strokes=4, putts=2, green_in_regulation=True),
+        HoleScore(hole_number=10, strokes=5, putts=None),
+    ]
+    r = Round(hole_scores=scores)
+    assert r.get_total_putts() is None
+    assert r.calculate_totals()["putts"] is None
+
+    r = Round(hole_scores=scores, total_putts=30, total_gir=7)
+    assert r.get_total_putts() == 30
+    assert r.get_total_gir() == 7
+    totals = r.calculate_totals()
+    assert (totals["putts"], totals["gir"], totals["back_nine"]) == (30, 7, 5)
 
 
 def test_round_nine_hole_calculations():
@@ -237,6 +284,15 @@ def test_round_get_hole_score_out_of_range():
     assert r.get_hole_score(2) is None   # beyond available scores
 
 
+def test_round_get_hole_score_follows_mutation():
+    r = Round(hole_scores=[HoleScore(hole_number=i, strokes=4) for i in range(1, 10)])
+    assert r.get_hole_score(3).strokes == 4
+
+    r.hole_scores = [HoleScore(hole_number=3, strokes=6)]
+    assert r.get_hole_score(3).strokes == 6
+    assert r.get_hole_score(1) is None
+
+
 def test_round_course_name_played():
     r = Round(course_name_played="Eagle Vines Golf Club")
     assert r.course_name_played == "Eagle Vines Golf Club"
@@ -0,0 +1,185 @@
+import asyncio
+import hashlib
+import io
+from pathlib import Path
+
+import pytest
+from fastapi import UploadFile
+from PIL import Image
+from starlette.datastructures import Headers
+
+scan_router = pytest.importorskip("api.routers.scan")
+
+
+class _CountingOCRService:
+    calls = 0
+
+    async def ocr_file(self, file_path):
+        type(self).calls += 1
+        return {"pages": [{"markdown": "| HOLE | 1 |\n| Par | 4 |"}]}
+
+    extract_markdown_text = staticmethod(scan_router.MistralOCRService.extract_markdown_text)
+
+
+@pytest.fixture
+def counting_pipeline(monkeypatch):
+    async def _fake_merge(markdown: str) -> str:
+        return f"merged:{markdown}"
+
+    _CountingOCRService.calls = 0
+    monkeypatch.setattr(scan_router, "MistralOCRService", _CountingOCRService)
+    monkeypatch.setattr(scan_router, "merge_split_tables", _fake_merge)
+    monkeypatch.setattr(scan_router, "OCR_RESULT_CACHE_ENABLED", True)
+    monkeypatch.setattr(scan_router, "_ocr_result_cache", type(scan_router._ocr_result_cache)())
+    return _CountingOCRService
+
+
+def test_ocr_pipeline_stores_result_for_upload_digest(counting_pipeline):
+    first = asyncio.run(scan_router._run_ocr_pipeline(Path("card.jpg"), "abc123"))
+
+    assert first.startswith("merged:")
+    assert scan_router._get_cached_ocr_markdown("abc123") == first
+    assert counting_pipeline.calls == 1
+
+
+def test_ocr_pipeline_cache_is_bounded_and_keyed_by_digest(counting_pipeline, monkeypatch):
+    monkeypatch.setattr(scan_router, "OCR_RESULT_CACHE_MAX_ENTRIES", 2)
+
+    for digest in ("a", "b", "c"):
+        asyncio.run(scan_router._run_ocr_pipeline(Path("card.jpg"), digest))
+    assert counting_pipeline.calls == 3
+    assert len(scan_router._ocr_result_cache) == 2
+
+    # "a" was evicted; "b" and "c" are still served from the cache.
+    assert scan_router._get_cached_ocr_markdown("a") is None
+    assert scan_router._get_cached_ocr_markdown("c").startswith("merged:")
+
+
+# ----------------------------------------------------------------
+# Endpoints: preprocessing is skipped when OCR text is already known
+# ----------------------------------------------------------------
+
+_CARD_MARKDOWN = """| HOLE | 1 | 2 | 3 | 4 | 5 | 6 | 7 | 8 | 9 |
+| PAR | 4 | 4 | 3 | 5 | 4 | 4 | 3 | 5 | 4 |
+| Tucker | 5 | 4 | 3 | 6 | 4 | 5 | 3 | 5 | 4 |"""
+
+
+def _png_upload() -> UploadFile:
+    buf = io.BytesIO()
+    Image.new("RGB", (8, 8), "white").save(buf, format="PNG")
+    buf.seek(0)
+    return UploadFile(buf, filename="card.png", headers=Headers({"content-type": "image/png"}))
+
+
+def _upload_digest(upload: UploadFile) -> str:
+    digest = hashlib.sha256(upload.file.read()).hexdigest()
+    upload.file.seek(0)
+    return digest
+
+
+@pytest.fixture
+def no_preprocess(counting_pipeline, monkeypatch):
+    calls = []
+
+    def _normalize(path, upload_digest):
+        calls.append(path)
+        raise AssertionError("preprocessing should have been skipped")
+
+    monkeypatch.setattr(scan_router, "_normalize_upload_for_ocr", _normalize)
+    return calls
+
+
+def _extract(upload: UploadFile, **kwargs):
+    params = dict(user_context=None, course_id=None, ocr_text=None, db=None, current_user=None)
+    params.update(kwargs)
+    return asyncio.run(scan_router.extract_scan(file=upload, **params))
+
+
+def test_prefetch_ocr_cache_hit_skips_preprocessing(no_preprocess):
+    upload = _png_upload()
+    scan_router._store_cached_ocr_markdown(_upload_digest(upload), "cached markdown")
+
+    result = asyncio.run(scan_router.prefetch_ocr(file=upload, current_user=None))
+
+    assert result == {"ocr_text": "cached markdown"}
+    assert no_preprocess == []
+    assert _CountingOCRService.calls == 0
+
+
+def test_extract_with_prefetched_text_skips_preprocessing(no_preprocess):
+    response = _extract(_png_upload(), ocr_text=_CARD_MARKDOWN)
+
+    assert response.round["hole_scores"][0]["strokes"] == 5
+    assert no_preprocess == []
+    assert _CountingOCRService.calls == 0
+
+
+def test_extract_cache_hit_skips_preprocessing(no_preprocess):
+    upload = _png_upload()
+    scan_router._store_cached_ocr_markdown(_upload_digest(upload), _CARD_MARKDOWN)
+
+    response = _extract(upload)
+
+    assert response.round["hole_scores"][0]["strokes"] == 5
+    assert no_preprocess == []
+    assert _CountingOCRService.calls == 0
+
+
+def test_extract_cancels_ocr_and_cleans_up_when_course_lookup_fails(counting_pipeline, monkeypatch, tmp_path):
+    events = []
+    ocr_started = None
+    temp_paths = []
+
+    real_save = scan_router._save_upload_to_temp
+
+    def _save(file, suffix):
+        path, digest = real_save(file, suffix)
+        temp_paths.append(path)
+        return path, digest
+
+    def _normalize(path, upload_digest):
+        normalized = tmp_path / "normalized.jpg"
+        normalized.write_bytes(b"jpeg")
+        temp_paths.append(normalized)
+        return normalized, False
+
+    async def _ocr(ocr_path, upload_digest=None):
+        events.append("ocr_started")
+        ocr_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            events.append("ocr_cancelled")
+            raise
+
+    class _Courses:
+        async def get_course(self, course_id):
+            await ocr_started.wait()  # the lookup overlaps the running OCR call
+            events.append("lookup_done")
+            return None
+
+    async def _run():
+        nonlocal ocr_started
+        ocr_started = asyncio.Event()
+        db = type("DB", (), {"courses": _Courses()})()
+        try:
+            return await scan_router.extract_scan(
+                file=_png_upload(), user_context=None,
+                course_id="00000000-0000-0000-0000-000000000001",
+                ocr_text=None, db=db, current_user=None,
+            )
+        finally:
+            events.append("extract_returned")
+
+    monkeypatch.setattr(scan_router, "_save_upload_to_temp", _save)
+    monkeypatch.setattr(scan_router, "_normalize_upload_for_ocr", _normalize)
+    monkeypatch.setattr(scan_router, "_run_ocr_pipeline", _ocr)
+
+    with pytest.raises(scan_router.HTTPException) as exc_info:
+        asyncio.run(_run())
+
+    assert exc_info.value.status_code == 404
+    # Cancelled and awaited before the endpoint returned, not left running.
+    assert events == ["ocr_started", "lookup_done", "ocr_cancelled", "extract_returned"]
+    assert len(temp_paths) == 2
+    assert not any(p.exists() for p in temp_paths)